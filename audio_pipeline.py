@@ -0,0 +1,217 @@
+"""
+Audio pipeline for pronunciation clips.
+
+The first time a word's clip is fetched the original MP3 is stored on disk
+and compact variants are generated from it with ffmpeg: each variant is
+silence-trimmed, loudness-normalized and downmixed to mono, so every word
+plays at the same volume. Variants that are missing because ffmpeg was
+unavailable are generated on a later request. Later requests are answered
+from disk with the smallest variant the client accepts.
+
+A variant that fails to transcode, say because ffmpeg lacks the encoder or
+the original is corrupt, is marked as failed and not tried again while
+serving; the transcode-audio command retries marked variants.
+"""
+import glob
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import urllib.parse
+
+# Trim leading and trailing silence (by trimming, reversing and trimming
+# again), then normalize to a common integrated loudness
+AUDIO_FILTERS = ','.join([
+    'silenceremove=start_periods=1:start_silence=0.05:start_threshold=-50dB',
+    'areverse',
+    'silenceremove=start_periods=1:start_silence=0.05:start_threshold=-50dB',
+    'areverse',
+    'loudnorm=I=-16:TP=-1.5:LRA=11',
+])
+
+ORIGINAL = 'original'
+
+# Variant name -> how it is served and how ffmpeg encodes it. Variants that
+# every browser can play are marked universal and are the only ones served
+# to clients that do not list a type explicitly.
+VARIANTS = {
+    ORIGINAL: {
+        'mimetype': 'audio/mpeg',
+        'extension': 'mp3',
+        'universal': True,
+        'encoder': None,
+    },
+    'mp3': {
+        'mimetype': 'audio/mpeg',
+        'extension': 'mp3',
+        'universal': True,
+        'encoder': ['-c:a', 'libmp3lame', '-b:a', '40k', '-ar', '24000', '-f', 'mp3'],
+    },
+    'opus': {
+        'mimetype': 'audio/ogg',
+        'extension': 'ogg',
+        'universal': False,
+        'encoder': ['-c:a', 'libopus', '-b:a', '24k', '-application', 'voip', '-ar', '48000', '-f', 'ogg'],
+    },
+}
+
+
+class AudioStore:
+    """
+    On-disk store of original clips and their transcoded variants.
+    """
+
+    def __init__(self, root, ffmpeg=None):
+        self.root = root
+        self.ffmpeg = ffmpeg or shutil.which('ffmpeg')
+
+    def path(self, word, variant):
+        # Spread files over subdirectories so no single directory gets huge
+        key = word.lower()
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        name = urllib.parse.quote(key, safe='')
+        return os.path.join(self.root, digest[:2], f'{name}.{variant}.{VARIANTS[variant]["extension"]}')
+
+    def failed_path(self, word, variant):
+        # Marks a variant whose transcode failed; holds the error message
+        return self.path(word, variant) + '.failed'
+
+    def has(self, word):
+        return os.path.exists(self.path(word, ORIGINAL))
+
+    def words(self):
+        """
+        Yield every word with a stored original clip.
+        """
+        suffix = f'.{ORIGINAL}.{VARIANTS[ORIGINAL]["extension"]}'
+        for path in glob.iglob(os.path.join(glob.escape(self.root), '*', '*' + suffix)):
+            yield urllib.parse.unquote(os.path.basename(path)[:-len(suffix)])
+
+    def variants(self, word):
+        """
+        Return (variant, path, size) for every stored variant of a word.
+        """
+        found = []
+        for variant in VARIANTS:
+            path = self.path(word, variant)
+            try:
+                found.append((variant, path, os.path.getsize(path)))
+            except OSError:
+                continue
+        return found
+
+    def store(self, word, data):
+        """
+        Store the original clip for a word and generate its variants.
+        """
+        self._write(self.path(word, ORIGINAL), data)
+        # A new original deserves a fresh attempt at every variant
+        self.generate_variants(word, retry=True)
+
+    def generate_variants(self, word, retry=False):
+        """
+        Transcode any variant of a stored word that is missing. Does nothing
+        without ffmpeg, in which case the original is served on its own.
+
+        A failed transcode is recorded and skipped on later calls, so a clip
+        that cannot be encoded does not cost an ffmpeg run on every request.
+        retry clears those records and tries again. Returns the number of
+        variants that failed.
+        """
+        if not self.ffmpeg:
+            return 0
+        original = self.path(word, ORIGINAL)
+        failures = 0
+        for variant in VARIANTS:
+            destination = self.path(word, variant)
+            if not VARIANTS[variant]['encoder'] or os.path.exists(destination):
+                continue
+            failed = self.failed_path(word, variant)
+            if os.path.exists(failed):
+                if not retry:
+                    continue
+                os.remove(failed)
+            try:
+                self.transcode(original, variant, destination)
+            except Exception as e:
+                print(f"Error transcoding '{word}' to {variant}: {str(e)}")
+                self._write(failed, str(e).encode('utf-8'))
+                failures += 1
+        return failures
+
+    def transcode(self, source, variant, destination):
+        """
+        Encode source into the given variant at destination using ffmpeg.
+        """
+        if not self.ffmpeg:
+            raise RuntimeError('ffmpeg is not installed')
+
+        # Encode to a temporary file first so readers never see partial output
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(destination), suffix='.tmp')
+        os.close(fd)
+        try:
+            command = [
+                self.ffmpeg, '-hide_banner', '-loglevel', 'error', '-y',
+                '-i', source, '-vn', '-map_metadata', '-1',
+                '-af', AUDIO_FILTERS, '-ac', '1',
+            ] + VARIANTS[variant]['encoder'] + [temp_path]
+            subprocess.run(command, check=True, capture_output=True, timeout=60)
+            os.replace(temp_path, destination)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def negotiate(self, word, accept):
+        """
+        Pick the smallest stored variant acceptable to the client.
+
+        accept is an iterable of (mimetype, quality) pairs, such as a
+        werkzeug Accept header. Returns (variant, path, mimetype), or None
+        when nothing is stored for the word.
+        """
+        explicit = set()
+        wildcard = False
+        for value, quality in accept:
+            if quality <= 0:
+                continue
+            mimetype = value.split(';')[0].strip().lower()
+            if mimetype in ('*/*', 'audio/*'):
+                wildcard = True
+            else:
+                explicit.add(mimetype)
+
+        # A missing Accept header means the client takes anything
+        if not explicit:
+            wildcard = True
+
+        stored = self.variants(word)
+        candidates = [
+            (size, variant, path, VARIANTS[variant]['mimetype'])
+            for variant, path, size in stored
+            if VARIANTS[variant]['mimetype'] in explicit or (wildcard and VARIANTS[variant]['universal'])
+        ]
+
+        # Nothing matched: a playable MP3 beats a 406 for audio elements
+        if not candidates:
+            candidates = [
+                (size, variant, path, VARIANTS[variant]['mimetype'])
+                for variant, path, size in stored
+                if VARIANTS[variant]['universal']
+            ]
+        if not candidates:
+            return None
+
+        size, variant, path, mimetype = min(candidates)
+        return variant, path, mimetype
+
+    def _write(self, path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except Exception:
+            os.remove(temp_path)
+            raise
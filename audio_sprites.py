@@ -0,0 +1,163 @@
+"""
+Audio sprites for the pronunciation guide.
+
+A sprite packs every clip of a guide section into a single file, separated
+by short silences, next to a JSON manifest giving each clip's offset and
+duration. The page fetches one file per section and seeks within it instead
+of requesting every word's clip separately.
+
+Sprite files are named after their content, and a rebuild keeps the
+previous generation, which manifests still cached by clients point to.
+"""
+import glob
+import hashlib
+import json
+import os
+import re
+import subprocess
+import tempfile
+
+from audio_pipeline import AUDIO_FILTERS, ORIGINAL, VARIANTS
+
+SAMPLE_RATE = 48000
+BYTES_PER_SAMPLE = 2
+
+# Silence before and between clips, so seeking slightly early or late never
+# plays part of a neighbouring word
+GAP_SECONDS = 0.25
+
+# Sprite encodings by the mimetype they are served as
+SPRITE_FORMATS = {
+    'audio/ogg': VARIANTS['opus'],
+    'audio/mpeg': VARIANTS['mp3'],
+}
+
+# <section>.<content hash>.<extension>
+SPRITE_FILENAME = re.compile(
+    r'(?P<section>\w+)\.[0-9a-f]{12}\.(?:%s)'
+    % '|'.join(re.escape(spec['extension']) for spec in SPRITE_FORMATS.values())
+)
+
+
+def sprite_section(filename):
+    """
+    Return the section a sprite file name belongs to, or None if it is not
+    the name of a built sprite.
+    """
+    match = SPRITE_FILENAME.fullmatch(filename)
+    return match and match.group('section')
+
+
+def decode_pcm(ffmpeg, path, filters=None):
+    """
+    Decode an audio file to raw 16-bit mono PCM at SAMPLE_RATE.
+    """
+    command = [ffmpeg, '-hide_banner', '-loglevel', 'error', '-i', path, '-vn']
+    if filters:
+        command += ['-af', filters]
+    command += ['-f', 's16le', '-ac', '1', '-ar', str(SAMPLE_RATE), '-']
+    return subprocess.run(command, check=True, capture_output=True, timeout=60).stdout
+
+
+def encode_pcm(ffmpeg, pcm, spec):
+    """
+    Encode raw PCM produced by decode_pcm with a variant's encoder settings.
+
+    The output goes to a file rather than a pipe: ffmpeg can only write the
+    LAME header, which tells players how much encoder delay and padding to
+    skip, to a seekable output. Without it every MP3 offset drifts late.
+    """
+    fd, temp_path = tempfile.mkstemp(suffix='.' + spec['extension'])
+    os.close(fd)
+    try:
+        command = [
+            ffmpeg, '-hide_banner', '-loglevel', 'error', '-y',
+            '-f', 's16le', '-ac', '1', '-ar', str(SAMPLE_RATE), '-i', '-',
+        ] + spec['encoder'] + [temp_path]
+        subprocess.run(command, input=pcm, check=True, capture_output=True, timeout=300)
+        with open(temp_path, 'rb') as f:
+            return f.read()
+    finally:
+        os.remove(temp_path)
+
+
+def build_sprite(store, name, clips, output_dir):
+    """
+    Build the sprite files and manifest for one section.
+
+    clips is an iterable of (key, word) pairs; key is what the page uses to
+    look a clip up in the manifest. Words missing from the audio store are
+    skipped. Returns the manifest.
+    """
+    if not store.ffmpeg:
+        raise RuntimeError('ffmpeg is required to build audio sprites')
+
+    gap = b'\0' * int(SAMPLE_RATE * GAP_SECONDS) * BYTES_PER_SAMPLE
+    chunks = [gap]
+    position = len(gap)
+    entries = {}
+
+    for key, word in clips:
+        if key in entries:
+            continue
+
+        # Prefer the normalized variant; the original needs the filters applied
+        stored = dict((variant, path) for variant, path, size in store.variants(word))
+        if 'mp3' in stored:
+            pcm = decode_pcm(store.ffmpeg, stored['mp3'])
+        elif ORIGINAL in stored:
+            pcm = decode_pcm(store.ffmpeg, stored[ORIGINAL], AUDIO_FILTERS)
+        else:
+            print(f"No audio stored for '{word}', leaving it out of the {name} sprite")
+            continue
+
+        entries[key] = {
+            'offset': round(position / BYTES_PER_SAMPLE / SAMPLE_RATE, 4),
+            'duration': round(len(pcm) / BYTES_PER_SAMPLE / SAMPLE_RATE, 4),
+        }
+        chunks += [pcm, gap]
+        position += len(pcm) + len(gap)
+
+    pcm = b''.join(chunks)
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, f'{name}.json')
+
+    # Content-hashed names let the sprites be cached forever
+    files = {}
+    for mimetype, spec in SPRITE_FORMATS.items():
+        data = encode_pcm(store.ffmpeg, pcm, spec)
+        filename = f'{name}.{hashlib.sha256(data).hexdigest()[:12]}.{spec["extension"]}'
+        _write(os.path.join(output_dir, filename), data)
+        files[mimetype] = filename
+
+    # Clients may hold the current manifest for a while after it is
+    # replaced, so the sprites it names outlive it by one build
+    keep = set(files.values()) | set(read_manifest(manifest_path).get('files', {}).values())
+
+    manifest = {'section': name, 'files': files, 'clips': entries}
+    _write(manifest_path, json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+
+    # Drop sprites from older builds of this section
+    for spec in SPRITE_FORMATS.values():
+        for old in glob.glob(os.path.join(output_dir, f'{glob.escape(name)}.*.{spec["extension"]}')):
+            if sprite_section(os.path.basename(old)) == name and os.path.basename(old) not in keep:
+                os.remove(old)
+    return manifest
+
+
+def read_manifest(path):
+    """
+    Return the manifest at path, or an empty dict if there is none.
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write(path, data):
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
@@ -0,0 +1,68 @@
+"""
+Benchmark transcode throughput and output sizes of the audio pipeline.
+
+Usage:
+    python benchmarks/bench_audio_pipeline.py [clip.mp3 ...] [--repeat N]
+
+Without clips, a speech-like test clip is synthesized with ffmpeg. Requires
+ffmpeg with libmp3lame and libopus on PATH.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from audio_pipeline import ORIGINAL, VARIANTS, AudioStore
+
+
+def synthesize_clip(path):
+    # Half a second of silence either side of a one second modulated tone,
+    # encoded the way Cambridge serves its clips
+    subprocess.run([
+        'ffmpeg', '-hide_banner', '-loglevel', 'error', '-y',
+        '-f', 'lavfi', '-i', 'sine=frequency=220:duration=1,volume=0.3',
+        '-af', 'adelay=500:all=1,apad=pad_dur=0.5,tremolo=f=6:d=0.7',
+        '-ac', '2', '-ar', '44100', '-c:a', 'libmp3lame', '-b:a', '128k', path,
+    ], check=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('clips', nargs='*', help='MP3 files to transcode')
+    parser.add_argument('--repeat', type=int, default=10, help='transcodes per clip and variant')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        clips = args.clips
+        if not clips:
+            clips = [os.path.join(workdir, 'synthetic.mp3')]
+            synthesize_clip(clips[0])
+
+        store = AudioStore(workdir)
+        original_bytes = sum(os.path.getsize(clip) for clip in clips)
+        print(f'{len(clips)} clip(s), {original_bytes} bytes original, {args.repeat} runs each')
+        print(f'{"variant":<10}{"ms/clip":>10}{"clips/s":>10}{"bytes":>10}{"ratio":>8}')
+
+        for variant, spec in VARIANTS.items():
+            if variant == ORIGINAL:
+                continue
+            destination = os.path.join(workdir, f'out.{spec["extension"]}')
+            output_bytes = 0
+            start = time.perf_counter()
+            for clip in clips:
+                for _ in range(args.repeat):
+                    store.transcode(clip, variant, destination)
+                output_bytes += os.path.getsize(destination)
+            elapsed = time.perf_counter() - start
+
+            runs = len(clips) * args.repeat
+            print(f'{variant:<10}{elapsed / runs * 1000:>10.1f}{runs / elapsed:>10.1f}'
+                  f'{output_bytes:>10}{output_bytes / original_bytes:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark worker start-up: import and app creation time, and the latency
+of the first requests a fresh process serves, with and without warm_up.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N]
+
+Every run is a new interpreter, so module imports are measured cold. Only
+local routes are requested; nothing goes upstream.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a fresh interpreter and prints its timings as JSON
+PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+timings = {}
+
+from app import create_app, warm_up
+timings['import'] = time.perf_counter() - start
+
+mark = time.perf_counter()
+app = create_app({'ENTRY_STORE_PATH': sys.argv[1]})
+timings['create_app'] = time.perf_counter() - mark
+
+if sys.argv[2] == 'warm':
+    mark = time.perf_counter()
+    warm_up(app)
+    timings['warm_up'] = time.perf_counter() - mark
+
+client = app.test_client()
+for name, url in [('/', '/'), ('/pronunciation-guide', '/pronunciation-guide'),
+                  ('/search/text', '/search/text?q=fear')]:
+    mark = time.perf_counter()
+    client.get(url)
+    timings['first ' + name] = time.perf_counter() - mark
+
+timings['total'] = time.perf_counter() - start
+print(json.dumps(timings))
+'''
+
+
+def run(mode, store_path):
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE, store_path, mode],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        store_path = os.path.join(workdir, 'entries.sqlite3')
+        for mode in ('lazy', 'warm'):
+            results = [run(mode, store_path) for _ in range(args.runs)]
+            print(f'{mode} ({args.runs} runs, median ms)')
+            for phase in results[0]:
+                median = statistics.median(result[phase] for result in results) * 1000
+                print(f'  {phase:<28}{median:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark the full-text index: build time, size on disk and query latency.
+
+Usage:
+    python benchmarks/bench_text_search.py [--entries N] [--queries N]
+
+Synthetic entries are generated from a Zipf-distributed vocabulary with a
+fixed seed, so runs are comparable.
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entry_store import EntryStore
+
+SYLLABLES = (
+    'ba be bi bo bu da de di do du fa fe fi fo ga ge gi go ka ke ki ko la le li lo lu '
+    'ma me mi mo mu na ne ni no pa pe pi po ra re ri ro ru sa se si so ta te ti to va ve vi wa we'
+).split()
+
+STOPWORDS = 'a an and of the to in with or for that is by'.split()
+
+
+def build_vocabulary(rng, size):
+    """
+    Make pseudo-words with Zipf weights, so a few words are very common and
+    most are rare, as in real definitions. Stopwords lead the ranking.
+    """
+    words = list(STOPWORDS)
+    seen = set(words)
+    while len(words) < size:
+        word = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    # Cumulative weights, so sampling does not re-sum them for every sentence
+    weights = list(itertools.accumulate(1 / rank for rank in range(1, size + 1)))
+    return words, weights
+
+
+POS = ['noun', 'verb', 'adjective', 'adverb', 'idiom', 'phrasal verb']
+
+
+def sentence(rng, vocabulary, low, high):
+    words, weights = vocabulary
+    return ' '.join(rng.choices(words, cum_weights=weights, k=rng.randint(low, high)))
+
+
+def synthetic_entries(count, rng, vocabulary):
+    for i in range(count):
+        parts = []
+        for _ in range(rng.randint(1, 3)):
+            definitions = [
+                {'text': sentence(rng, vocabulary, 6, 16),
+                 'examples': [sentence(rng, vocabulary, 5, 12) for _ in range(rng.randint(0, 3))]}
+                for _ in range(rng.randint(1, 4))
+            ]
+            parts.append({'type': rng.choice(POS), 'definitions': definitions})
+        yield json.dumps({
+            'word': f'{vocabulary[0][i % len(vocabulary[0])]}{i}',
+            'pronunciation': '',
+            'audio_url': '',
+            'parts_of_speech': parts,
+        })
+
+
+def index_size(path):
+    # dbstat is optional in SQLite builds; report None where it is missing
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute(
+            "SELECT SUM(pgsize) FROM dbstat WHERE name LIKE 'entry_text%'"
+        ).fetchone()[0]
+    except sqlite3.OperationalError:
+        return None
+    finally:
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--entries', type=int, default=50000)
+    parser.add_argument('--queries', type=int, default=500)
+    parser.add_argument('--vocabulary', type=int, default=30000, help='distinct words in the corpus')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocabulary = build_vocabulary(rng, args.vocabulary)
+    # Queries use everyday content words plus the odd stopword
+    query_words = vocabulary[0][:5000]
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, 'entries.sqlite3')
+        store = EntryStore(path)
+
+        start = time.perf_counter()
+        store.load_snapshot(synthetic_entries(args.entries, rng, vocabulary))
+        build = time.perf_counter() - start
+
+        total = sum(os.path.getsize(os.path.join(workdir, name)) for name in os.listdir(workdir))
+        fts = index_size(path)
+        print(f'{args.entries} entries loaded and indexed in {build:.2f}s '
+              f'({args.entries / build:.0f} entries/s)')
+        print(f'database size {total / 1e6:.1f} MB'
+              + (f', full-text index {fts / 1e6:.1f} MB' if fts else ''))
+
+        for terms in (1, 2, 4):
+            timings = []
+            for _ in range(args.queries):
+                query = ' '.join(rng.choice(query_words) for _ in range(terms))
+                start = time.perf_counter()
+                store.search_text(query, limit=20)
+                timings.append((time.perf_counter() - start) * 1000)
+            timings.sort()
+            p95 = timings[int(len(timings) * 0.95) - 1]
+            print(f'{terms}-term queries: median {statistics.median(timings):.2f} ms, p95 {p95:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""
+Bulk export of stored dictionary entries.
+
+Exports are generator pipelines: entries are read from the store in
+batches, filtered and encoded one at a time, so memory use stays flat
+however many entries are exported.
+"""
+import json
+
+FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+# Definitions per Parquet row group
+PARQUET_BATCH_SIZE = 5000
+
+
+def has_examples(entry):
+    return any(
+        definition['examples']
+        for pos in entry['parts_of_speech']
+        for definition in pos['definitions']
+    )
+
+
+def filter_entries(entries, pos=None, has_audio=None, examples=None):
+    """
+    Keep only (word, entry) pairs matching every given filter.
+
+    pos keeps entries with a part of speech of that type; has_audio and
+    examples keep entries with (True) or without (False) an audio URL or
+    any example sentence.
+    """
+    for word, entry in entries:
+        if pos and not any(part['type'] == pos for part in entry['parts_of_speech']):
+            continue
+        if has_audio is not None and bool(entry.get('audio_url')) != has_audio:
+            continue
+        if examples is not None and has_examples(entry) != examples:
+            continue
+        yield word, entry
+
+
+def iter_ndjson(entries):
+    """
+    Encode (word, entry) pairs as NDJSON, one entry per line.
+    """
+    for word, entry in entries:
+        yield json.dumps(dict(entry, word=word), ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+def iter_definition_rows(entries):
+    """
+    Flatten entries to one row per definition.
+    """
+    for word, entry in entries:
+        for pos in entry['parts_of_speech']:
+            for definition in pos['definitions']:
+                yield {
+                    'word': word,
+                    'pronunciation': entry.get('pronunciation', ''),
+                    'audio_url': entry.get('audio_url', ''),
+                    'pos': pos['type'],
+                    'definition': definition['text'],
+                    'examples': definition['examples'],
+                }
+
+
+class _StreamSink:
+    """
+    Write-only file object that hands written bytes back to a generator.
+
+    Parquet footers hold absolute offsets, so tell() reports everything
+    written so far even though the buffer is drained after each batch.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def writable(self):
+        return True
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def iter_parquet(entries):
+    """
+    Encode entries as Parquet, one row per definition, yielding each row
+    group as soon as it is written. Requires pyarrow.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ('word', pa.string()),
+        ('pronunciation', pa.string()),
+        ('audio_url', pa.string()),
+        ('pos', pa.string()),
+        ('definition', pa.string()),
+        ('examples', pa.list_(pa.string())),
+    ])
+
+    sink = _StreamSink()
+    writer = pq.ParquetWriter(sink, schema)
+    batch = []
+    for row in iter_definition_rows(entries):
+        batch.append(row)
+        if len(batch) >= PARQUET_BATCH_SIZE:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            batch = []
+            yield sink.drain()
+    if batch:
+        writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+    writer.close()
+    yield sink.drain()
+
+
+def export_entries(entries, format):
+    """
+    Return a generator of encoded chunks for the given export format.
+    """
+    if format == 'parquet':
+        return iter_parquet(entries)
+    return iter_ndjson(entries)
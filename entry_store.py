@@ -0,0 +1,328 @@
+"""
+Local store of scraped dictionary entries.
+
+Every entry scraped from Cambridge Dictionary is kept in a SQLite database,
+keyed by its normalized headword, so repeat lookups, exports and other
+local features never have to go back upstream. Entries can also be loaded
+from NDJSON snapshots produced by an export.
+
+Definitions and examples are also indexed in an FTS5 full-text table that
+is updated with every write, so entries can be found by meaning and ranked
+with BM25 without touching upstream. Where SQLite is built without FTS5 the
+store works as before, only without full-text search.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    word TEXT PRIMARY KEY,
+    entry TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    etag TEXT
+)
+"""
+
+# Full-text index over each entry's definitions and examples. Its rowid is
+# the rowid of the entry it indexes.
+TEXT_INDEX_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS entry_text USING fts5(
+    definitions,
+    examples,
+    tokenize = 'porter unicode61'
+)
+"""
+
+# BM25 column weights, stored as the table's default rank: a match in a
+# definition counts for more than one in an example sentence
+TEXT_INDEX_RANK = 'bm25(2.0, 1.0)'
+
+# Words too common to help rank a reverse lookup; dropping them keeps the
+# posting lists a query has to merge short
+STOPWORDS = frozenset(
+    'a an and are as at be by for from has in is it its of on or that the '
+    'to was were which with'.split()
+)
+
+# Rows pulled from SQLite at a time while iterating, which bounds memory use
+# no matter how many entries are stored, and entries written per transaction
+# while loading a snapshot
+BATCH_SIZE = 500
+
+
+def normalize_word(word):
+    return ' '.join(word.lower().split())
+
+
+def encode_entry(payload):
+    """
+    Return (etag, body) for a JSON payload. Sorted keys and fixed separators
+    make the encoding, and so the strong ETag, deterministic for equal
+    payloads.
+    """
+    body = json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(body).hexdigest()[:32], body
+
+
+def entry_text(entry):
+    """
+    Return the (definitions, examples) text of an entry for indexing.
+    """
+    definitions = []
+    examples = []
+    for pos in entry['parts_of_speech']:
+        for definition in pos['definitions']:
+            definitions.append(definition['text'])
+            examples.extend(definition['examples'])
+    return '\n'.join(definitions), '\n'.join(examples)
+
+
+def fts5_available(connection):
+    """
+    Return whether this SQLite build can create FTS5 tables.
+    """
+    try:
+        connection.execute('CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(text)')
+    except sqlite3.OperationalError:
+        return False
+    connection.execute('DROP TABLE temp.fts5_probe')
+    return True
+
+
+def text_query(query):
+    """
+    Turn free text into an FTS5 query matching any of its terms.
+
+    Every term is quoted, so FTS5 operators and punctuation in user input
+    are treated as plain words.
+    """
+    terms = re.findall(r'\w+', query.lower())
+    # Keep stopwords only when the query has nothing else
+    terms = [term for term in terms if term not in STOPWORDS] or terms
+    return ' OR '.join(f'"{term}"' for term in terms)
+
+
+class EntryStore:
+    """
+    SQLite-backed store of dictionary entries.
+
+    A connection is opened per operation rather than held on the instance,
+    so the store is safe to share between threads and forked workers.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(SCHEMA)
+            # Stores created before ETags were kept gain the column; their
+            # rows are encoded on read until they are next written
+            columns = [row[1] for row in connection.execute('PRAGMA table_info(entries)')]
+            if 'etag' not in columns:
+                connection.execute('ALTER TABLE entries ADD COLUMN etag TEXT')
+
+            # Without FTS5 entries are stored but not indexed
+            self.text_search = fts5_available(connection)
+            if not self.text_search:
+                return
+            indexed = connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'entry_text'"
+            ).fetchone()
+            connection.execute(TEXT_INDEX_SCHEMA)
+            # Stores created before the index existed are indexed once
+            if not indexed:
+                connection.execute(
+                    "INSERT INTO entry_text (entry_text, rank) VALUES ('rank', ?)",
+                    (TEXT_INDEX_RANK,)
+                )
+                self._rebuild_text_index(connection)
+
+    @contextlib.contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            # WAL lets readers stream exports while a worker writes
+            connection.execute('PRAGMA journal_mode=WAL')
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def get(self, word, max_age=None):
+        """
+        Return the stored entry for a word, or None if it is missing or
+        older than max_age seconds.
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                'SELECT word, entry, fetched_at FROM entries WHERE word = ?',
+                (normalize_word(word),)
+            ).fetchone()
+        if row is None:
+            return None
+        word, entry, fetched_at = row
+        if max_age is not None and time.time() - fetched_at > max_age:
+            return None
+        # Rows written before entries carried their headword get it here
+        return dict(json.loads(entry), word=word)
+
+    def get_encoded(self, word, max_age=None):
+        """
+        Return (etag, body) for the stored entry of a word without decoding
+        or re-encoding it, or None if it is missing or older than max_age
+        seconds. body is the same encoding encode_entry produces.
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                'SELECT word, entry, fetched_at, etag FROM entries WHERE word = ?',
+                (normalize_word(word),)
+            ).fetchone()
+        if row is None:
+            return None
+        word, entry, fetched_at, etag = row
+        if max_age is not None and time.time() - fetched_at > max_age:
+            return None
+        if etag is None:
+            return encode_entry(dict(json.loads(entry), word=word))
+        return etag, entry.encode('utf-8')
+
+    def put(self, word, entry, fetched_at=None):
+        """
+        Store or replace the entry for a word, whose 'word' is set to the
+        normalized headword. Returns (etag, body) for the stored entry, as
+        encode_entry would, so callers never encode it a second time.
+        """
+        with self._connect() as connection:
+            return self._save(connection, word, entry, time.time() if fetched_at is None else fetched_at)
+
+    def load_snapshot(self, lines):
+        """
+        Load entries from NDJSON lines, each an entry with a 'word' key.
+        Returns the number of entries loaded.
+
+        Entries are committed BATCH_SIZE at a time, so lookups storing
+        entries meanwhile wait for one batch rather than the whole import.
+        An import that fails part way keeps the batches already committed.
+        """
+        count = 0
+        now = time.time()
+        with self._connect() as connection:
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                self._save(connection, entry['word'], entry, now)
+                count += 1
+                if count % BATCH_SIZE == 0:
+                    connection.commit()
+        return count
+
+    def search_text(self, query, limit=20):
+        """
+        Rank stored entries against free text in their definitions and
+        examples with BM25. Returns dicts with the word, its score (lower
+        is better) and a snippet of the best matching text, which may come
+        from a definition or an example.
+
+        Raises RuntimeError if SQLite lacks FTS5; check text_search first.
+        """
+        if not self.text_search:
+            raise RuntimeError('Full-text search requires SQLite with FTS5')
+        match = text_query(query)
+        if not match:
+            return []
+        with self._connect() as connection:
+            rows = connection.execute(
+                '''
+                SELECT entries.word, matches.rank, matches.snippet
+                FROM (
+                    SELECT rowid, rank, snippet(entry_text, -1, '', '', '…', 16) AS snippet
+                    FROM entry_text
+                    WHERE entry_text MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                ) AS matches
+                JOIN entries ON entries.rowid = matches.rowid
+                ORDER BY matches.rank
+                ''',
+                (match, limit)
+            ).fetchall()
+        return [
+            {'word': word, 'score': round(score, 4), 'snippet': snippet}
+            for word, score, snippet in rows
+        ]
+
+    def _save(self, connection, word, entry, fetched_at):
+        # Every copy of an entry carries the same headword, however the
+        # first requester happened to type it
+        word = normalize_word(word)
+        entry = dict(entry, word=word)
+
+        # Keep the canonical encoding and its ETag, so a lookup can be
+        # answered, or revalidated with a 304, without touching JSON
+        etag, body = encode_entry(entry)
+
+        # An upsert keeps the entry's rowid, which keys its index row.
+        # RETURNING would need SQLite 3.35, so the rowid is looked up after.
+        connection.execute(
+            '''
+            INSERT INTO entries (word, entry, fetched_at, etag) VALUES (?, ?, ?, ?)
+            ON CONFLICT (word) DO UPDATE
+            SET entry = excluded.entry, fetched_at = excluded.fetched_at, etag = excluded.etag
+            ''',
+            (word, body.decode('utf-8'), fetched_at, etag)
+        )
+        if not self.text_search:
+            return etag, body
+
+        rowid = connection.execute('SELECT rowid FROM entries WHERE word = ?', (word,)).fetchone()[0]
+        definitions, examples = entry_text(entry)
+        connection.execute('DELETE FROM entry_text WHERE rowid = ?', (rowid,))
+        connection.execute(
+            'INSERT INTO entry_text (rowid, definitions, examples) VALUES (?, ?, ?)',
+            (rowid, definitions, examples)
+        )
+        return etag, body
+
+    def _rebuild_text_index(self, connection):
+        connection.execute('DELETE FROM entry_text')
+        cursor = connection.execute('SELECT rowid, entry FROM entries')
+        while True:
+            rows = cursor.fetchmany(BATCH_SIZE)
+            if not rows:
+                break
+            connection.executemany(
+                'INSERT INTO entry_text (rowid, definitions, examples) VALUES (?, ?, ?)',
+                [(rowid,) + entry_text(json.loads(entry)) for rowid, entry in rows]
+            )
+
+    def iter_entries(self, prefix=None):
+        """
+        Yield (word, entry) for every stored entry in headword order,
+        optionally limited to headwords starting with prefix.
+        """
+        query = 'SELECT word, entry FROM entries'
+        params = ()
+        if prefix:
+            # A range on the primary key uses its index, unlike LIKE
+            prefix = normalize_word(prefix)
+            query += ' WHERE word >= ? AND word < ?'
+            params = (prefix, prefix + '\U0010ffff')
+        query += ' ORDER BY word'
+
+        with self._connect() as connection:
+            cursor = connection.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(BATCH_SIZE)
+                if not rows:
+                    break
+                for word, entry in rows:
+                    yield word, json.loads(entry)
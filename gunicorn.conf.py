@@ -0,0 +1,30 @@
+"""
+Gunicorn settings for production.
+
+    gunicorn -c gunicorn.conf.py
+
+Worker count, threads and port can be set through the environment.
+"""
+import os
+
+wsgi_app = 'wsgi:app'
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Import, configure and warm the app once in the master process. Workers are
+# forked from it and share the loaded modules, compiled templates and
+# rendered guide page copy-on-write, so a new worker serves its first
+# request without any start-up work of its own.
+preload_app = True
+
+# A small fixed default: each worker holds its own copy of anything it
+# loads after the fork, and threads already cover upstream waits. Raise it
+# with WEB_CONCURRENCY on larger hosts.
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+
+# Lookups mostly wait on Cambridge Dictionary, so threads keep a worker busy
+# while requests are in flight upstream
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Scraping plus first-time audio transcoding can take a few seconds
+timeout = 60
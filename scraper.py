@@ -0,0 +1,254 @@
+"""
+Scraping of entries and pronunciation audio from Cambridge Dictionary.
+
+This module pulls in requests and BeautifulSoup, which dominate import
+time, so the application only imports it when a lookup needs upstream.
+"""
+import requests
+from bs4 import BeautifulSoup
+import urllib.parse
+
+class WordNotFound(Exception):
+    """
+    Raised when Cambridge Dictionary has no definitions for a word.
+    """
+
+def get_cambridge_audio_url(word):
+    """
+    Get the audio URL from Cambridge Dictionary.
+    """
+    try:
+        # Encode the word for URL
+        encoded_word = urllib.parse.quote(word.lower())
+        url = f'https://dictionary.cambridge.org/dictionary/english/{encoded_word}'
+        
+        # Send request with headers to mimic a browser
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+        response = requests.get(url, headers=headers)
+        response.raise_for_status()
+        
+        # Parse the HTML
+        soup = BeautifulSoup(response.text, 'html.parser')
+        
+        # Find the UK pronunciation audio element
+        audio_element = soup.find('span', {'class': 'uk dpron-i'})
+        if audio_element:
+            source_element = audio_element.find('source', {'type': 'audio/mpeg'})
+            if source_element and 'src' in source_element.attrs:
+                audio_url = source_element['src']
+                if not audio_url.startswith('http'):
+                    audio_url = 'https://dictionary.cambridge.org' + audio_url
+                return audio_url
+        
+        return None
+        
+    except Exception as e:
+        print(f"Error fetching audio for word '{word}': {str(e)}")
+        return None
+
+def fetch_cambridge_audio(word):
+    """
+    Download the original UK pronunciation MP3 for a word, or return None.
+    """
+    # Get the Cambridge Dictionary audio URL
+    audio_url = get_cambridge_audio_url(word)
+    if not audio_url:
+        return None
+    
+    # Forward the request to Cambridge Dictionary
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Referer': 'https://dictionary.cambridge.org/'
+    }
+    response = requests.get(audio_url, headers=headers)
+    response.raise_for_status()
+    return response.content
+
+def scrape_cambridge_dictionary(word):
+    # Format the URL for the Cambridge Dictionary
+    url = f'https://dictionary.cambridge.org/dictionary/english/{word.lower().replace(" ", "-")}'
+    
+    # Set a user agent to avoid being blocked
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+    
+    # Make the request
+    response = requests.get(url, headers=headers)
+    
+    # Check if the request was successful
+    if response.status_code != 200:
+        raise Exception(f'Failed to retrieve data: HTTP {response.status_code}')
+    
+    # Parse the HTML content
+    soup = BeautifulSoup(response.text, 'html.parser')
+    
+    # Initialize the entry dictionary
+    entry = {
+        'word': word,
+        'pronunciation': '',
+        'audio_url': '',
+        'parts_of_speech': []
+    }
+    
+    # Extract UK pronunciation and audio URL
+    uk_pron_div = soup.find('span', class_='uk dpron-i')
+    if uk_pron_div:
+        ipa_span = uk_pron_div.find('span', class_='ipa')
+        if ipa_span:
+            entry['pronunciation'] = ipa_span.text
+            
+        # Extract audio URL
+        audio_source = uk_pron_div.find('source', type='audio/mpeg')
+        if audio_source and 'src' in audio_source.attrs:
+            audio_url = audio_source['src']
+            if audio_url.startswith('//'):
+                audio_url = 'https:' + audio_url
+            elif audio_url.startswith('/'):
+                audio_url = 'https://dictionary.cambridge.org' + audio_url
+            entry['audio_url'] = audio_url
+    
+    # Find all parts of speech sections
+    pos_sections = soup.find_all('div', class_='pr dictionary')
+    
+    for pos_section in pos_sections:
+        # Find the part of speech
+        pos_header = pos_section.find('div', class_='pos-header')
+        if not pos_header:
+            continue
+            
+        pos_type = pos_header.find('span', class_='pos')
+        if not pos_type:
+            continue
+            
+        pos_entry = {
+            'type': pos_type.text,
+            'definitions': []
+        }
+        
+        # Find all definition blocks
+        def_blocks = pos_section.find_all('div', class_='def-block')
+        
+        for def_block in def_blocks:
+            # Extract definition
+            def_div = def_block.find('div', class_='def')
+            if not def_div:
+                continue
+                
+            def_text = def_div.text.strip()
+            
+            # Extract examples
+            examples = []
+            example_divs = def_block.find_all('div', class_='examp')
+            for example_div in example_divs:
+                example_text = example_div.text.strip()
+                examples.append(example_text)
+            
+            def_entry = {
+                'text': def_text,
+                'examples': examples
+            }
+            
+            pos_entry['definitions'].append(def_entry)
+        
+        if pos_entry['definitions']:
+            entry['parts_of_speech'].append(pos_entry)
+    
+    # If no parts of speech were found, try to find idioms or phrasal verbs
+    if not entry['parts_of_speech']:
+        idiom_sections = soup.find_all('div', class_='idiom-block')
+        for idiom_section in idiom_sections:
+            idiom_header = idiom_section.find('div', class_='idiom-title')
+            if not idiom_header:
+                continue
+                
+            pos_entry = {
+                'type': 'idiom',
+                'definitions': []
+            }
+            
+            # Find all definition blocks within the idiom
+            def_blocks = idiom_section.find_all('div', class_='def-block')
+            
+            for def_block in def_blocks:
+                # Extract definition
+                def_div = def_block.find('div', class_='def')
+                if not def_div:
+                    continue
+                    
+                def_text = def_div.text.strip()
+                
+                # Extract examples
+                examples = []
+                example_divs = def_block.find_all('div', class_='examp')
+                for example_div in example_divs:
+                    example_text = example_div.text.strip()
+                    examples.append(example_text)
+                
+                def_entry = {
+                    'text': def_text,
+                    'examples': examples
+                }
+                
+                pos_entry['definitions'].append(def_entry)
+            
+            if pos_entry['definitions']:
+                entry['parts_of_speech'].append(pos_entry)
+    
+    # If still no definitions found, try to find a different format
+    if not entry['parts_of_speech']:
+        entry_bodies = soup.find_all('div', class_='entry-body')
+        for entry_body in entry_bodies:
+            pos_headers = entry_body.find_all('div', class_='pos-header')
+            for pos_header in pos_headers:
+                pos_type_span = pos_header.find('span', class_='pos')
+                if not pos_type_span:
+                    continue
+                    
+                pos_type = pos_type_span.text
+                
+                pos_entry = {
+                    'type': pos_type,
+                    'definitions': []
+                }
+                
+                # Find the corresponding entry body block
+                entry_body_block = pos_header.find_next('div', class_='pos-body')
+                if not entry_body_block:
+                    continue
+                    
+                # Find all sense blocks
+                sense_blocks = entry_body_block.find_all('div', class_='sense-block')
+                
+                for sense_block in sense_blocks:
+                    # Extract definition
+                    def_div = sense_block.find('div', class_='def')
+                    if not def_div:
+                        continue
+                        
+                    def_text = def_div.text.strip()
+                    
+                    # Extract examples
+                    examples = []
+                    example_divs = sense_block.find_all('div', class_='examp')
+                    for example_div in example_divs:
+                        example_text = example_div.text.strip()
+                        examples.append(example_text)
+                    
+                    def_entry = {
+                        'text': def_text,
+                        'examples': examples
+                    }
+                    
+                    pos_entry['definitions'].append(def_entry)
+                
+                if pos_entry['definitions']:
+                    entry['parts_of_speech'].append(pos_entry)
+    
+    # If no definitions were found, raise an exception
+    if not entry['parts_of_speech']:
+        raise WordNotFound('No definitions found for this word')
+    
+    return entry
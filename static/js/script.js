@@ -1,35 +1,471 @@
+// Plays pronunciation clips through Web Audio, keeping decoded buffers so a
+// clip is fetched and decoded once no matter how often it is played
+const audioManager = (function() {
+    const MAX_CONCURRENT_FETCHES = 4;
+    // Room for every clip on the pronunciation guide (141) plus its section
+    // sprites, so preloading the whole page never evicts its own clips
+    const MAX_BUFFERS = 160;
+    
+    // url -> Promise of a decoded AudioBuffer, in least recently used order
+    const buffers = new Map();
+    // urls whose buffer has finished decoding
+    const decoded = new Set();
+    // audio url -> where the clip sits inside a loaded section sprite
+    const spriteClips = new Map();
+    // Fetches waiting for a free slot; urgent ones jump to the front
+    const queue = [];
+    let activeFetches = 0;
+    let context = null;
+    
+    // Ask the server for the compact Opus variant where the browser plays it
+    const probe = document.createElement('audio');
+    const ACCEPT = probe.canPlayType && probe.canPlayType('audio/ogg; codecs="opus"')
+        ? 'audio/ogg, audio/mpeg;q=0.9'
+        : 'audio/mpeg';
+    const SPRITE_TYPES = {
+        'audio/ogg': 'audio/ogg; codecs="opus"',
+        'audio/mpeg': 'audio/mpeg'
+    };
+    
+    function getContext() {
+        if (!context) {
+            const AudioContextClass = window.AudioContext || window.webkitAudioContext;
+            context = AudioContextClass ? new AudioContextClass() : null;
+        }
+        return context;
+    }
+    
+    function drain() {
+        while (activeFetches < MAX_CONCURRENT_FETCHES && queue.length > 0) {
+            const job = queue.shift();
+            activeFetches++;
+            fetch(job.url, { headers: { Accept: ACCEPT } })
+                .then(response => {
+                    if (!response.ok) {
+                        throw new Error(`HTTP ${response.status}`);
+                    }
+                    return response.arrayBuffer();
+                })
+                .then(job.resolve, job.reject)
+                .finally(() => {
+                    activeFetches--;
+                    drain();
+                });
+        }
+    }
+    
+    function enqueue(url, urgent) {
+        return new Promise((resolve, reject) => {
+            const job = { url: url, resolve: resolve, reject: reject };
+            if (urgent) {
+                queue.unshift(job);
+            } else {
+                queue.push(job);
+            }
+            drain();
+        });
+    }
+    
+    function promote(url) {
+        // Move a queued preload to the front when the user asks for it
+        const position = queue.findIndex(job => job.url === url);
+        if (position > 0) {
+            queue.unshift(queue.splice(position, 1)[0]);
+        }
+    }
+    
+    function evict(url) {
+        buffers.delete(url);
+        decoded.delete(url);
+        // A clip still waiting for a fetch slot is dropped rather than
+        // downloaded only to be thrown away
+        const position = queue.findIndex(job => job.url === url);
+        if (position >= 0) {
+            queue.splice(position, 1)[0].reject(new Error('Evicted before loading'));
+        }
+    }
+    
+    function decode(data) {
+        // The callback form also works in Safari, which lacks the promise one
+        return new Promise((resolve, reject) => {
+            getContext().decodeAudioData(data, resolve, reject);
+        });
+    }
+    
+    function load(url, urgent) {
+        if (buffers.has(url)) {
+            const buffer = buffers.get(url);
+            buffers.delete(url);
+            buffers.set(url, buffer);
+            if (urgent) {
+                promote(url);
+            }
+            return buffer;
+        }
+        
+        const buffer = enqueue(url, urgent).then(decode);
+        // Forget failed loads so the next click retries them
+        buffer.then(
+            () => {
+                if (buffers.get(url) === buffer) {
+                    decoded.add(url);
+                }
+            },
+            () => {
+                if (buffers.get(url) === buffer) {
+                    buffers.delete(url);
+                }
+            }
+        );
+        buffers.set(url, buffer);
+        if (buffers.size > MAX_BUFFERS) {
+            evict(buffers.keys().next().value);
+        }
+        return buffer;
+    }
+    
+    function preload(urls) {
+        if (!getContext()) {
+            return;
+        }
+        urls.forEach(url => load(url, false).catch(() => {}));
+    }
+    
+    function loadSprite(section) {
+        // Fetch a section's manifest, then its whole sprite in one request
+        return fetch(`/audio/sprites/${encodeURIComponent(section)}.json`)
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`HTTP ${response.status}`);
+                }
+                return response.json();
+            })
+            .then(manifest => {
+                const mimetype = Object.keys(manifest.files)
+                    .find(type => probe.canPlayType && probe.canPlayType(SPRITE_TYPES[type] || type));
+                if (!mimetype || !getContext()) {
+                    throw new Error('No playable sprite format');
+                }
+                const spriteUrl = `/audio/sprites/${manifest.files[mimetype]}`;
+                Object.keys(manifest.clips).forEach(url => {
+                    const clip = manifest.clips[url];
+                    spriteClips.set(url, { sprite: spriteUrl, offset: clip.offset, duration: clip.duration });
+                });
+                return load(spriteUrl, false);
+            });
+    }
+    
+    function isLoaded(url) {
+        const clip = spriteClips.get(url);
+        const key = clip ? clip.sprite : url;
+        return decoded.has(key);
+    }
+    
+    function resolveClip(url) {
+        // Play from the section sprite when there is one, otherwise (or if
+        // the sprite fails) fetch the clip on its own
+        const single = () => load(url, true).then(buffer => ({ buffer: buffer }));
+        const clip = spriteClips.get(url);
+        if (!clip) {
+            return single();
+        }
+        return load(clip.sprite, true).then(
+            buffer => ({ buffer: buffer, offset: clip.offset, duration: clip.duration }),
+            single
+        );
+    }
+    
+    function play(url) {
+        const audioContext = getContext();
+        if (!audioContext) {
+            // No Web Audio support: fall back to a media element
+            const audio = new Audio(url);
+            return audio.play();
+        }
+        
+        // Contexts created by preloading start suspended, and iOS Safari only
+        // lets one resume during the click itself, not once the clip has
+        // loaded. A source started while it is still resuming plays as soon
+        // as it runs, so nothing waits on the resume.
+        if (audioContext.state === 'suspended') {
+            audioContext.resume().catch(() => {});
+        }
+        
+        return resolveClip(url).then(clip => {
+            const source = audioContext.createBufferSource();
+            source.buffer = clip.buffer;
+            source.connect(audioContext.destination);
+            if (clip.duration) {
+                source.start(0, clip.offset, clip.duration);
+            } else {
+                source.start();
+            }
+        });
+    }
+    
+    return { load, loadSprite, preload, play, isLoaded };
+})();
+
 // Function to play audio from URL - defined globally
 function playAudio(url) {
     // Get the button that triggered the audio
     const button = event.currentTarget;
     const originalText = button.innerHTML;
     
-    // Show loading state
-    button.innerHTML = '⌛';
-    button.disabled = true;
-    
-    const audio = new Audio(url);
+    // Show loading state unless the clip is already decoded
+    if (!audioManager.isLoaded(url)) {
+        button.innerHTML = '⌛';
+        button.disabled = true;
+    }
     
-    audio.addEventListener('canplaythrough', () => {
-        // Reset button state
-        button.innerHTML = originalText;
-        button.disabled = false;
-        audio.play().catch(error => {
+    audioManager.play(url)
+        .then(() => {
+            // Reset button state
+            button.innerHTML = originalText;
+            button.disabled = false;
+        })
+        .catch(error => {
             console.error('Error playing audio:', error);
             button.innerHTML = '❌';
+            button.disabled = false;
             setTimeout(() => {
                 button.innerHTML = originalText;
             }, 1000);
         });
+}
+
+// Preload the audio of each guide section as it scrolls into view
+function preloadVisibleSections() {
+    const sections = document.querySelectorAll('.phoneme-section');
+    if (sections.length === 0 || !('IntersectionObserver' in window)) {
+        return;
+    }
+    
+    const observer = new IntersectionObserver(entries => {
+        entries.forEach(entry => {
+            if (!entry.isIntersecting) {
+                return;
+            }
+            observer.unobserve(entry.target);
+            const buttons = entry.target.querySelectorAll('[data-audio-url]');
+            const urls = new Set(Array.from(buttons, button => button.dataset.audioUrl));
+            
+            // One sprite per section; fall back to the individual clips
+            // when no sprite has been built
+            const section = entry.target.dataset.sprite;
+            const loading = section ? audioManager.loadSprite(section) : Promise.reject();
+            loading.catch(() => audioManager.preload(urls));
+        });
+    }, { rootMargin: '200px 0px' });
+    
+    sections.forEach(section => observer.observe(section));
+}
+
+document.addEventListener('DOMContentLoaded', preloadVisibleSections);
+
+// Client-side cache of dictionary entries, persisted in IndexedDB and capped
+// by evicting the least recently used words. Records expire with the
+// max-age the server sent them with.
+const entryCache = (function() {
+    const DB_NAME = 'cambridge-dictionary';
+    const STORE_NAME = 'entries';
+    const MAX_ENTRIES = 200;
+    
+    // In-memory copy of recently used records; Map keeps insertion order,
+    // so the first key is always the least recently used one
+    const memory = new Map();
+    let dbPromise = null;
+    
+    function normalize(word) {
+        return word.trim().toLowerCase().replace(/\s+/g, ' ');
+    }
+    
+    function isFresh(record) {
+        // Records saved before expiry was tracked have no expires and are dropped
+        return Boolean(record && record.expires > Date.now());
+    }
+    
+    function remember(key, record) {
+        memory.delete(key);
+        memory.set(key, record);
+        if (memory.size > MAX_ENTRIES) {
+            memory.delete(memory.keys().next().value);
+        }
+    }
+    
+    function openDatabase() {
+        if (!dbPromise) {
+            dbPromise = new Promise((resolve, reject) => {
+                if (!window.indexedDB) {
+                    reject(new Error('IndexedDB is not available'));
+                    return;
+                }
+                const request = indexedDB.open(DB_NAME, 1);
+                request.onupgradeneeded = () => {
+                    const store = request.result.createObjectStore(STORE_NAME, { keyPath: 'word' });
+                    store.createIndex('lastUsed', 'lastUsed');
+                };
+                request.onsuccess = () => resolve(request.result);
+                request.onerror = () => reject(request.error);
+            });
+        }
+        return dbPromise;
+    }
+    
+    function transaction(mode, callback) {
+        return openDatabase().then(db => new Promise((resolve, reject) => {
+            const tx = db.transaction(STORE_NAME, mode);
+            const result = callback(tx.objectStore(STORE_NAME));
+            tx.oncomplete = () => resolve(result && 'result' in result ? result.result : undefined);
+            tx.onerror = () => reject(tx.error);
+        }));
+    }
+    
+    function prune(store) {
+        // Delete the oldest records once the store grows past its cap
+        const countRequest = store.count();
+        countRequest.onsuccess = () => {
+            let excess = countRequest.result - MAX_ENTRIES;
+            if (excess <= 0) {
+                return;
+            }
+            store.index('lastUsed').openCursor().onsuccess = event => {
+                const cursor = event.target.result;
+                if (cursor && excess > 0) {
+                    cursor.delete();
+                    excess--;
+                    cursor.continue();
+                }
+            };
+        };
+    }
+    
+    function get(word) {
+        const key = normalize(word);
+        if (memory.has(key)) {
+            const record = memory.get(key);
+            if (isFresh(record)) {
+                remember(key, record);
+                touch(key, record);
+                return Promise.resolve(record.data);
+            }
+            memory.delete(key);
+        }
+        return transaction('readonly', store => store.get(key))
+            .then(record => {
+                if (!isFresh(record)) {
+                    return null;
+                }
+                remember(key, record);
+                touch(key, record);
+                return record.data;
+            })
+            .catch(() => null);
+    }
+    
+    function touch(key, record) {
+        // Refresh the LRU timestamp without blocking the caller
+        transaction('readwrite', store => {
+            store.put({ word: key, data: record.data, expires: record.expires, lastUsed: Date.now() });
+        }).catch(() => {});
+    }
+    
+    function put(word, data, maxAge) {
+        const key = normalize(word);
+        const record = { data: data, expires: Date.now() + maxAge * 1000 };
+        remember(key, record);
+        return transaction('readwrite', store => {
+            store.put({ word: key, data: data, expires: record.expires, lastUsed: Date.now() });
+            prune(store);
+        }).catch(() => {});
+    }
+    
+    function has(word) {
+        return isFresh(memory.get(normalize(word)));
+    }
+    
+    return { normalize, get, put, has };
+})();
+
+// Seconds a response stays fresh for: its max-age less the time it has
+// already spent in the browser's or a shared cache, which may have served
+// it stale while revalidating
+function freshnessLeft(response) {
+    const maxAge = /max-age=(\d+)/.exec(response.headers.get('Cache-Control') || '');
+    if (!maxAge) {
+        return 0;
+    }
+    const date = Date.parse(response.headers.get('Date') || '');
+    const sinceDate = isNaN(date) ? 0 : (Date.now() - date) / 1000;
+    const age = Math.max(Number(response.headers.get('Age')) || 0, sinceDate, 0);
+    return Number(maxAge[1]) - age;
+}
+
+// Fetch an entry from the server and cache it for as long as the response
+// allows. With storedOnly the server answers from its local store and never
+// scrapes upstream.
+function fetchEntry(key, storedOnly) {
+    // GET lets the browser and any shared cache reuse the response
+    const url = `/search?word=${encodeURIComponent(key)}` + (storedOnly ? '&stored=1' : '');
+    return fetch(url).then(response => {
+        const freshFor = freshnessLeft(response);
+        return response.json().then(data => {
+            // Errors are left to the HTTP cache, which keeps them briefly
+            if (!data.error && freshFor > 0) {
+                entryCache.put(key, data, freshFor);
+            }
+            return data;
+        });
     });
+}
+
+// Look up a word, answering from the client cache when possible and sharing
+// a single request between concurrent lookups of the same word
+const pendingLookups = new Map();
+// Prefetches in flight, which answer a lookup when the word was stored
+const pendingPrefetches = new Map();
+
+function lookupWord(word) {
+    const key = entryCache.normalize(word);
+    if (pendingLookups.has(key)) {
+        return pendingLookups.get(key);
+    }
     
-    audio.addEventListener('error', () => {
-        console.error('Error loading audio:', audio.error);
-        button.innerHTML = '❌';
-        button.disabled = false;
-        setTimeout(() => {
-            button.innerHTML = originalText;
-        }, 1000);
+    const prefetch = pendingPrefetches.get(key);
+    const found = prefetch
+        ? prefetch.then(data => (data && !data.error ? data : null), () => null)
+        : entryCache.get(key);
+    const lookup = found.then(data => data || fetchEntry(key, false));
+    
+    pendingLookups.set(key, lookup);
+    const clear = () => pendingLookups.delete(key);
+    lookup.then(clear, clear);
+    return lookup;
+}
+
+// Speculatively fetch a word the user is likely to look up next, once the
+// browser is idle and only when the connection is not metered. Prefetches
+// are served from the server's local store only, so a half-typed word never
+// causes an upstream scrape.
+function prefetchWord(word) {
+    const connection = navigator.connection;
+    if (connection && (connection.saveData || /2g/.test(connection.effectiveType || ''))) {
+        return;
+    }
+    const key = entryCache.normalize(word);
+    const busy = () => entryCache.has(key) || pendingLookups.has(key) || pendingPrefetches.has(key);
+    if (key.length < 3 || busy()) {
+        return;
+    }
+    const schedule = window.requestIdleCallback || (callback => setTimeout(callback, 200));
+    schedule(() => {
+        if (busy()) {
+            return;
+        }
+        const prefetch = entryCache.get(key).then(cached => cached || fetchEntry(key, true));
+        pendingPrefetches.set(key, prefetch);
+        const clear = () => pendingPrefetches.delete(key);
+        prefetch.then(clear, clear);
     });
 }
 
@@ -39,27 +475,30 @@ document.addEventListener('DOMContentLoaded', function() {
     const resultsContainer = document.getElementById('results-container');
     const loadingElement = document.getElementById('loading');
     
-    // Only add event listener if search form exists (on dictionary page)
-    if (searchForm) {
-        searchForm.addEventListener('submit', function(e) {
-            e.preventDefault();
-            const word = wordInput.value.trim();
-            
-            if (word) {
-                // Show loading spinner
-                resultsContainer.style.display = 'none';
-                loadingElement.style.display = 'block';
-                
-                // Send request to backend
-                const formData = new FormData();
-                formData.append('word', word);
-                
-                fetch('/search', {
-                    method: 'POST',
-                    body: formData
-                })
-            .then(response => response.json())
+    const PREFETCH_DELAY = 500;
+    const RENDER_BATCH_SIZE = 20;
+    let prefetchTimer = null;
+    let renderToken = 0;
+    let lookupToken = 0;
+    
+    function showWord(word, updateHistory) {
+        // Only the latest lookup may render or touch history; earlier ones
+        // that resolve late are dropped
+        const token = ++lookupToken;
+        
+        // Show loading spinner unless the entry is already cached
+        const cached = entryCache.has(word);
+        if (!cached) {
+            resultsContainer.style.display = 'none';
+            loadingElement.style.display = 'block';
+        }
+        
+        lookupWord(word)
             .then(data => {
+                if (token !== lookupToken) {
+                    return;
+                }
+                
                 // Hide loading spinner
                 loadingElement.style.display = 'none';
                 resultsContainer.style.display = 'block';
@@ -67,23 +506,96 @@ document.addEventListener('DOMContentLoaded', function() {
                 if (data.error) {
                     displayError(data.error);
                 } else {
-                    displayResults(data);
+                    displayResults(data, word);
+                    if (updateHistory) {
+                        history.pushState({ word: word }, '', `?word=${encodeURIComponent(word)}`);
+                    }
                 }
             })
             .catch(error => {
+                if (token !== lookupToken) {
+                    return;
+                }
+                
                 // Hide loading spinner
                 loadingElement.style.display = 'none';
                 resultsContainer.style.display = 'block';
                 displayError('An error occurred while fetching the dictionary data.');
                 console.error('Error:', error);
             });
+    }
+    
+    // Only add event listener if search form exists (on dictionary page)
+    if (searchForm) {
+        searchForm.addEventListener('submit', function(e) {
+            e.preventDefault();
+            const word = wordInput.value.trim();
+            
+            if (word) {
+                clearTimeout(prefetchTimer);
+                showWord(word, true);
+            }
+        });
+        
+        // Prefetch the word being typed once the user pauses, if the server
+        // already has it stored
+        wordInput.addEventListener('input', function() {
+            clearTimeout(prefetchTimer);
+            const word = wordInput.value.trim();
+            if (word) {
+                prefetchTimer = setTimeout(() => prefetchWord(word), PREFETCH_DELAY);
+            }
+        });
+        
+        // Going back or forward re-renders the word from the cache
+        window.addEventListener('popstate', function(e) {
+            if (e.state && e.state.word) {
+                wordInput.value = e.state.word;
+                showWord(e.state.word, false);
+            }
+        });
+        
+        const initialWord = new URLSearchParams(window.location.search).get('word');
+        if (initialWord) {
+            wordInput.value = initialWord;
+            history.replaceState({ word: initialWord }, '');
+            showWord(initialWord, false);
+        }
+    }
+    
+    function createDefinition(def, index) {
+        const definition = document.createElement('div');
+        definition.className = 'definition';
+        
+        const defText = document.createElement('div');
+        defText.className = 'definition-text';
+        defText.textContent = `${index + 1}. ${def.text}`;
+        definition.appendChild(defText);
+        
+        // Display examples
+        if (def.examples && def.examples.length > 0) {
+            const examples = document.createElement('div');
+            examples.className = 'examples';
+            
+            def.examples.forEach(example => {
+                const exampleEl = document.createElement('div');
+                exampleEl.className = 'example';
+                exampleEl.textContent = example;
+                examples.appendChild(exampleEl);
+            });
+            
+            definition.appendChild(examples);
         }
-    });
-}
+        
+        return definition;
+    }
     
-    function displayResults(data) {
-        // Clear previous results
-        resultsContainer.innerHTML = '';
+    function displayResults(data, word) {
+        // Drop any batches still queued for a previous word
+        const token = ++renderToken;
+        
+        // Build everything off-document and attach it in one go
+        const fragment = document.createDocumentFragment();
         
         // Create word header
         const wordHeader = document.createElement('div');
@@ -93,7 +605,7 @@ document.addEventListener('DOMContentLoaded', function() {
         wordTitle.className = 'word-title';
         
         const wordHeading = document.createElement('h2');
-        wordHeading.textContent = data.word;
+        wordHeading.textContent = data.word || word;
         wordTitle.appendChild(wordHeading);
         
         if (data.pronunciation) {
@@ -122,7 +634,10 @@ document.addEventListener('DOMContentLoaded', function() {
         }
         
         wordHeader.appendChild(wordTitle);
-        resultsContainer.appendChild(wordHeader);
+        fragment.appendChild(wordHeader);
+        
+        // Definitions are queued so large entries can be rendered in batches
+        const pending = [];
         
         // Display each part of speech
         if (data.parts_of_speech && data.parts_of_speech.length > 0) {
@@ -138,44 +653,42 @@ document.addEventListener('DOMContentLoaded', function() {
                 // Display definitions and examples
                 if (pos.definitions && pos.definitions.length > 0) {
                     pos.definitions.forEach((def, index) => {
-                        const definition = document.createElement('div');
-                        definition.className = 'definition';
-                        
-                        const defText = document.createElement('div');
-                        defText.className = 'definition-text';
-                        defText.textContent = `${index + 1}. ${def.text}`;
-                        definition.appendChild(defText);
-                        
-                        // Display examples
-                        if (def.examples && def.examples.length > 0) {
-                            const examples = document.createElement('div');
-                            examples.className = 'examples';
-                            
-                            def.examples.forEach(example => {
-                                const exampleEl = document.createElement('div');
-                                exampleEl.className = 'example';
-                                exampleEl.textContent = example;
-                                examples.appendChild(exampleEl);
-                            });
-                            
-                            definition.appendChild(examples);
-                        }
-                        
-                        posSection.appendChild(definition);
+                        pending.push({ section: posSection, def: def, index: index });
                     });
                 }
                 
-                resultsContainer.appendChild(posSection);
+                fragment.appendChild(posSection);
             });
         } else {
             const noDefinitions = document.createElement('div');
             noDefinitions.className = 'no-definitions';
             noDefinitions.textContent = 'No definitions found for this word.';
-            resultsContainer.appendChild(noDefinitions);
+            fragment.appendChild(noDefinitions);
+        }
+        
+        function renderBatch() {
+            pending.splice(0, RENDER_BATCH_SIZE).forEach(item => {
+                item.section.appendChild(createDefinition(item.def, item.index));
+            });
+        }
+        
+        // The first batch goes in before the fragment is attached so the top
+        // of the entry appears in a single layout
+        renderBatch();
+        resultsContainer.replaceChildren(fragment);
+        
+        function renderRemaining() {
+            if (token !== renderToken || pending.length === 0) {
+                return;
+            }
+            renderBatch();
+            requestAnimationFrame(renderRemaining);
         }
+        requestAnimationFrame(renderRemaining);
     }
     
     function displayError(message) {
+        renderToken++;
         resultsContainer.innerHTML = `
             <div class="error-message">
                 <p>${message}</p>
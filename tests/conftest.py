@@ -0,0 +1,63 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entry_store import EntryStore
+
+
+def make_entry(definitions, pos='noun', audio_url='', pronunciation=''):
+    """
+    Build an entry shaped like the scraper's output from (text, examples)
+    pairs.
+    """
+    return {
+        'pronunciation': pronunciation,
+        'audio_url': audio_url,
+        'parts_of_speech': [{
+            'type': pos,
+            'definitions': [{'text': text, 'examples': examples} for text, examples in definitions],
+        }],
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return EntryStore(str(tmp_path / 'entries.sqlite3'))
+
+
+@pytest.fixture
+def app(tmp_path):
+    from app import create_app
+    return create_app({
+        'TESTING': True,
+        'ENTRY_STORE_PATH': str(tmp_path / 'entries.sqlite3'),
+        'AUDIO_CACHE_DIR': str(tmp_path / 'audio'),
+        'SPRITE_DIR': str(tmp_path / 'sprites'),
+    })
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def scrapes(monkeypatch):
+    """
+    Replace the scraper with a stub that records the words it is asked for.
+    """
+    import scraper
+
+    words = []
+
+    def scrape(word):
+        words.append(word)
+        if word == 'missing':
+            raise scraper.WordNotFound(f"No entry found for '{word}'")
+        return make_entry([(f'the meaning of {word}', [])])
+
+    monkeypatch.setattr(scraper, 'scrape_cambridge_dictionary', scrape)
+    return words
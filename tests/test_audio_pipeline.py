@@ -0,0 +1,108 @@
+import os
+
+import pytest
+
+from audio_pipeline import ORIGINAL, AudioStore
+
+
+@pytest.fixture
+def audio(tmp_path):
+    store = AudioStore(str(tmp_path / 'audio'))
+    store.ffmpeg = None
+    return store
+
+
+def stored(audio, word, sizes):
+    """
+    Write fake files for the given variants, with the given sizes.
+    """
+    for variant, size in sizes.items():
+        audio._write(audio.path(word, variant), b'x' * size)
+
+
+def chosen(audio, word, accept):
+    result = audio.negotiate(word, accept)
+    return result and result[0]
+
+
+@pytest.fixture
+def hello(audio):
+    stored(audio, 'hello', {ORIGINAL: 3000, 'mp3': 600, 'opus': 400})
+    return audio
+
+
+def test_negotiate_nothing_stored(audio):
+    assert audio.negotiate('hello', [('*/*', 1)]) is None
+
+
+def test_negotiate_without_accept_serves_smallest_universal(hello):
+    assert chosen(hello, 'hello', []) == 'mp3'
+
+
+def test_negotiate_wildcard_skips_non_universal(hello):
+    assert chosen(hello, 'hello', [('*/*', 1)]) == 'mp3'
+    assert chosen(hello, 'hello', [('audio/*', 1)]) == 'mp3'
+
+
+def test_negotiate_explicit_type(hello):
+    assert chosen(hello, 'hello', [('audio/ogg', 1), ('audio/mpeg', 0.9)]) == 'opus'
+    assert chosen(hello, 'hello', [('audio/mpeg', 1)]) == 'mp3'
+
+
+def test_negotiate_ignores_parameters_and_case(hello):
+    assert chosen(hello, 'hello', [('Audio/OGG; codecs=opus', 1)]) == 'opus'
+
+
+def test_negotiate_q_zero_excludes_type(hello):
+    assert chosen(hello, 'hello', [('audio/ogg', 0), ('audio/mpeg', 1)]) == 'mp3'
+
+
+def test_negotiate_falls_back_to_universal(hello):
+    assert chosen(hello, 'hello', [('audio/webm', 1)]) == 'mp3'
+
+
+def test_negotiate_original_only(audio):
+    stored(audio, 'hello', {ORIGINAL: 3000})
+    assert audio.negotiate('hello', [('audio/ogg', 1)]) == (ORIGINAL, audio.path('hello', ORIGINAL), 'audio/mpeg')
+
+
+def test_negotiate_opus_only_variant_not_sent_to_wildcard(audio):
+    stored(audio, 'hello', {ORIGINAL: 3000, 'opus': 400})
+    assert chosen(audio, 'hello', [('*/*', 1)]) == ORIGINAL
+
+
+def test_failed_variants_are_not_retried(audio, monkeypatch):
+    audio.ffmpeg = 'ffmpeg'
+    attempts = []
+
+    def transcode(source, variant, destination):
+        attempts.append(variant)
+        if variant == 'opus':
+            raise RuntimeError('Unknown encoder libopus')
+        audio._write(destination, b'mp3')
+
+    monkeypatch.setattr(audio, 'transcode', transcode)
+    audio.store('hello', b'original')
+    assert attempts == ['mp3', 'opus']
+    assert os.path.exists(audio.failed_path('hello', 'opus'))
+
+    # Serving the word again does not run ffmpeg
+    assert audio.generate_variants('hello') == 0
+    assert attempts == ['mp3', 'opus']
+
+    # An explicit retry does
+    assert audio.generate_variants('hello', retry=True) == 1
+    assert attempts == ['mp3', 'opus', 'opus']
+
+
+def test_no_ffmpeg_is_quiet(audio, capsys):
+    audio.store('hello', b'original')
+    assert audio.generate_variants('hello') == 0
+    assert capsys.readouterr().out == ''
+    assert [variant for variant, path, size in audio.variants('hello')] == [ORIGINAL]
+
+
+def test_words(audio):
+    stored(audio, 'hello', {ORIGINAL: 1})
+    stored(audio, 'ice cream', {ORIGINAL: 1, 'mp3': 1})
+    assert sorted(audio.words()) == ['hello', 'ice cream']
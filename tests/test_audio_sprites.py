@@ -0,0 +1,71 @@
+import json
+import os
+
+import pytest
+
+import audio_sprites
+from audio_pipeline import ORIGINAL, AudioStore
+
+
+@pytest.fixture
+def audio(tmp_path, monkeypatch):
+    store = AudioStore(str(tmp_path / 'audio'), ffmpeg='ffmpeg')
+    # Stand-ins for ffmpeg: a clip decodes to its stored bytes and an
+    # encoding is the PCM tagged with its extension
+    monkeypatch.setattr(audio_sprites, 'decode_pcm', lambda ffmpeg, path, filters=None: open(path, 'rb').read())
+    monkeypatch.setattr(audio_sprites, 'encode_pcm', lambda ffmpeg, pcm, spec: spec['extension'].encode() + pcm)
+    return store
+
+
+@pytest.fixture
+def sprites(tmp_path):
+    return tmp_path / 'sprites'
+
+
+def build(audio, output_dir, clip):
+    audio._write(audio.path('cat', ORIGINAL), clip)
+    return audio_sprites.build_sprite(audio, 'vowels', [('/audio/cat', 'cat')], str(output_dir))
+
+
+def sprite_files(output_dir):
+    return sorted(name for name in os.listdir(output_dir) if not name.endswith('.json'))
+
+
+def test_manifest_lists_clips_and_files(audio, sprites):
+    manifest = build(audio, sprites, b'\1\0' * 480)
+    gap = audio_sprites.GAP_SECONDS
+    assert manifest['clips'] == {'/audio/cat': {'offset': gap, 'duration': 0.01}}
+    assert sorted(manifest['files'].values()) == sprite_files(sprites)
+    with open(sprites / 'vowels.json', encoding='utf-8') as f:
+        assert json.load(f) == manifest
+
+
+def test_rebuild_keeps_previous_generation(audio, sprites):
+    first = build(audio, sprites, b'\1\0')
+    second = build(audio, sprites, b'\2\0')
+    assert sprite_files(sprites) == sorted(list(first['files'].values()) + list(second['files'].values()))
+
+    third = build(audio, sprites, b'\3\0')
+    assert sprite_files(sprites) == sorted(list(second['files'].values()) + list(third['files'].values()))
+
+
+def test_unchanged_rebuild_keeps_its_files(audio, sprites):
+    first = build(audio, sprites, b'\1\0')
+    assert build(audio, sprites, b'\1\0')['files'] == first['files']
+    assert sprite_files(sprites) == sorted(first['files'].values())
+
+
+def test_get_sprite_serves_only_built_sprites(app, client):
+    sprite_dir = app.config['SPRITE_DIR']
+    os.makedirs(sprite_dir)
+    for name in ('vowels.0123456789ab.mp3', 'vowels.0123456789ab.mp3.tmp', 'notes.txt'):
+        with open(os.path.join(sprite_dir, name), 'wb') as f:
+            f.write(b'data')
+
+    response = client.get('/audio/sprites/vowels.0123456789ab.mp3')
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == app.config['SPRITE_CACHE_CONTROL']
+    response.close()
+
+    for name in ('vowels.0123456789ab.mp3.tmp', 'notes.txt', 'other.0123456789ab.mp3'):
+        assert client.get(f'/audio/sprites/{name}').status_code == 404
@@ -0,0 +1,44 @@
+import json
+
+from conftest import make_entry
+from entry_export import filter_entries, iter_ndjson
+
+ENTRIES = [
+    ('run', make_entry([('move fast', ['She runs daily.'])], pos='verb', audio_url='/audio/run')),
+    ('table', make_entry([('a piece of furniture', [])], pos='noun')),
+    ('quick', make_entry([('fast', ['A quick reply.'])], pos='adjective')),
+]
+
+
+def words(entries):
+    return [word for word, entry in entries]
+
+
+def test_filter_entries_without_filters_keeps_everything():
+    assert words(filter_entries(ENTRIES)) == ['run', 'table', 'quick']
+
+
+def test_filter_entries_by_pos():
+    assert words(filter_entries(ENTRIES, pos='noun')) == ['table']
+
+
+def test_filter_entries_by_audio():
+    assert words(filter_entries(ENTRIES, has_audio=True)) == ['run']
+    assert words(filter_entries(ENTRIES, has_audio=False)) == ['table', 'quick']
+
+
+def test_filter_entries_by_examples():
+    assert words(filter_entries(ENTRIES, examples=True)) == ['run', 'quick']
+    assert words(filter_entries(ENTRIES, examples=False)) == ['table']
+
+
+def test_filter_entries_combines_filters():
+    assert words(filter_entries(ENTRIES, examples=True, has_audio=False)) == ['quick']
+
+
+def test_iter_ndjson_writes_one_entry_per_line():
+    chunks = list(iter_ndjson([('café', make_entry([('a small restaurant', [])]))]))
+    assert len(chunks) == 1
+    assert chunks[0].endswith(b'\n')
+    assert 'café'.encode('utf-8') in chunks[0]
+    assert json.loads(chunks[0])['word'] == 'café'
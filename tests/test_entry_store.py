@@ -0,0 +1,66 @@
+import io
+import json
+import time
+
+import pytest
+
+from conftest import make_entry
+from entry_export import iter_ndjson
+from entry_store import EntryStore, encode_entry
+
+
+def test_put_normalizes_headword(store):
+    store.put('  Hello   World ', make_entry([('a greeting', [])]))
+    assert store.get('HELLO world') == dict(make_entry([('a greeting', [])]), word='hello world')
+
+
+def test_get_missing_and_expired(store):
+    assert store.get('absent') is None
+    store.put('old', make_entry([('aged', [])]), fetched_at=time.time() - 100)
+    assert store.get('old', max_age=50) is None
+    assert store.get('old', max_age=200)['word'] == 'old'
+
+
+def test_put_returns_the_stored_encoding(store):
+    encoded = store.put('Cat', make_entry([('a small animal', ['The cat sat.'])]))
+    assert encoded == store.get_encoded('cat')
+    assert encoded == encode_entry(store.get('cat'))
+
+
+def test_put_replaces_entry(store):
+    store.put('run', make_entry([('move fast', [])]))
+    store.put('run', make_entry([('operate a machine', [])], pos='verb'))
+    entries = list(store.iter_entries())
+    assert len(entries) == 1
+    assert entries[0][1]['parts_of_speech'][0]['type'] == 'verb'
+
+
+def test_iter_entries_prefix(store):
+    for word in ('apple', 'apply', 'banana'):
+        store.put(word, make_entry([(word, [])]))
+    assert [word for word, entry in store.iter_entries()] == ['apple', 'apply', 'banana']
+    assert [word for word, entry in store.iter_entries(prefix='APP')] == ['apple', 'apply']
+
+
+def test_snapshot_round_trip(store, tmp_path):
+    store.put('Dog', make_entry([('a pet', ['Walk the dog.'])], audio_url='/audio/dog'))
+    store.put('café', make_entry([('a small restaurant', [])]))
+    originals = {word: store.get(word) for word in ('dog', 'café')}
+    snapshot = b''.join(iter_ndjson(store.iter_entries())).decode('utf-8')
+
+    restored = EntryStore(str(tmp_path / 'restored.sqlite3'))
+    assert restored.load_snapshot(io.StringIO(snapshot + '\n')) == 2
+    for word, entry in originals.items():
+        assert restored.get(word) == entry
+        assert restored.get_encoded(word) == store.get_encoded(word)
+
+
+def test_snapshot_commits_in_batches(store, monkeypatch, tmp_path):
+    monkeypatch.setattr('entry_store.BATCH_SIZE', 2)
+    lines = [json.dumps(dict(make_entry([(f'sense {i}', [])]), word=f'word{i}')) for i in range(5)]
+    lines.append('not json')
+
+    # Batches committed before a bad line are kept
+    with pytest.raises(ValueError):
+        store.load_snapshot(lines)
+    assert [word for word, entry in store.iter_entries()] == ['word0', 'word1', 'word2', 'word3']
@@ -0,0 +1,55 @@
+import pytest
+
+
+def test_etag_is_stable_across_get_and_post(client, scrapes):
+    first = client.get('/search?word=hello')
+    again = client.get('/search?word=Hello')
+    posted = client.post('/search', data={'word': 'hello'})
+    assert first.headers['ETag']
+    assert again.headers['ETag'] == first.headers['ETag']
+    assert posted.headers['ETag'] == first.headers['ETag']
+    assert posted.data == first.data
+
+
+def test_if_none_match_returns_empty_304(client, scrapes):
+    etag = client.get('/search?word=hello').headers['ETag']
+    response = client.get('/search?word=hello', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+    assert response.headers['ETag'] == etag
+    assert response.headers['Cache-Control'] == client.application.config['SEARCH_CACHE_CONTROL']
+
+
+def test_if_none_match_accepts_weak_and_listed_etags(client, scrapes):
+    etag = client.get('/search?word=hello').headers['ETag']
+    assert client.get('/search?word=hello', headers={'If-None-Match': 'W/' + etag}).status_code == 304
+    assert client.get('/search?word=hello', headers={'If-None-Match': f'"other", {etag}'}).status_code == 304
+
+
+def test_stale_etag_gets_full_response(client, scrapes):
+    response = client.get('/search?word=hello', headers={'If-None-Match': '"stale"'})
+    assert response.status_code == 200
+    assert response.json['word'] == 'hello'
+
+
+@pytest.mark.parametrize('url, setting', [
+    ('/search?word=hello', 'SEARCH_CACHE_CONTROL'),
+    ('/search?word=missing', 'SEARCH_NOT_FOUND_CACHE_CONTROL'),
+    ('/search', 'SEARCH_ERROR_CACHE_CONTROL'),
+])
+def test_cache_control_policies(client, scrapes, url, setting):
+    response = client.get(url)
+    assert response.headers['Cache-Control'] == client.application.config[setting]
+    assert response.headers['ETag']
+
+
+def test_scraper_failure_uses_error_policy(client, monkeypatch):
+    import scraper
+
+    def fail(word):
+        raise ConnectionError('upstream unavailable')
+
+    monkeypatch.setattr(scraper, 'scrape_cambridge_dictionary', fail)
+    response = client.get('/search?word=hello')
+    assert response.json == {'error': 'upstream unavailable'}
+    assert response.headers['Cache-Control'] == client.application.config['SEARCH_ERROR_CACHE_CONTROL']
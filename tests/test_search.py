@@ -0,0 +1,43 @@
+import json
+import sqlite3
+
+from entry_store import EntryStore
+
+
+def locked(*args, **kwargs):
+    raise sqlite3.OperationalError('database is locked')
+
+
+def test_lookup_is_stored(client, scrapes):
+    first = client.get('/search?word=Hello')
+    second = client.get('/search?word=hello')
+    assert first.json['word'] == 'hello'
+    assert second.data == first.data
+    assert scrapes == ['Hello']
+
+
+def test_unreadable_store_falls_back_to_scraper(client, scrapes, monkeypatch):
+    monkeypatch.setattr(EntryStore, 'get_encoded', locked)
+    response = client.get('/search?word=hello')
+    assert response.status_code == 200
+    assert response.json['word'] == 'hello'
+    assert scrapes == ['hello']
+
+
+def test_unwritable_store_still_returns_entry(client, scrapes, monkeypatch):
+    monkeypatch.setattr(EntryStore, 'put', locked)
+    response = client.get('/search?word=Hello')
+    assert response.status_code == 200
+    assert response.json['word'] == 'hello'
+    assert response.json['parts_of_speech'][0]['definitions'][0]['text'] == 'the meaning of Hello'
+
+
+def test_stored_only_lookup_never_scrapes(client, scrapes):
+    response = client.get('/search?word=hello&stored=1')
+    assert response.json == {'error': 'Word not stored'}
+    assert response.headers['Cache-Control'] == 'no-store'
+    assert scrapes == []
+
+    client.get('/search?word=hello')
+    assert json.loads(client.get('/search?word=hello&stored=1').data)['word'] == 'hello'
+    assert scrapes == ['hello']
@@ -0,0 +1,99 @@
+import pytest
+
+from conftest import make_entry
+from entry_store import EntryStore, text_query
+
+
+@pytest.fixture
+def indexed(store):
+    store.put('run', make_entry([('to move quickly on foot', ['She was running for the bus.'])], pos='verb'))
+    store.put('sprint', make_entry([('to run a short distance very fast', [])], pos='verb'))
+    store.put('table', make_entry([('a piece of furniture with a flat top', ['Put the plates on the table.'])]))
+    return store
+
+
+def words(results):
+    return [result['word'] for result in results]
+
+
+def test_stemming_matches_other_forms(indexed):
+    assert set(words(indexed.search_text('runs'))) == {'run', 'sprint'}
+    assert words(indexed.search_text('furnitures')) == ['table']
+
+
+def test_definition_matches_outrank_examples(indexed):
+    # 'run' appears in sprint's definition but only in run's example
+    assert words(indexed.search_text('run')) == ['sprint', 'run']
+
+
+def test_results_carry_score_and_snippet(indexed):
+    [result] = indexed.search_text('furniture')
+    assert result['word'] == 'table'
+    assert result['score'] < 0
+    assert 'furniture' in result['snippet']
+
+
+def test_limit(indexed):
+    assert len(indexed.search_text('run', limit=1)) == 1
+
+
+@pytest.mark.parametrize('query', [
+    'furniture NOT table',
+    'furniture AND',
+    '"furniture',
+    'furniture*',
+    'definitions: furniture',
+    'NEAR(furniture flat)',
+    '(furniture)',
+])
+def test_fts_syntax_is_treated_as_words(indexed, query):
+    assert words(indexed.search_text(query)) == ['table']
+
+
+def test_stopwords_are_dropped_from_mixed_queries():
+    assert text_query('a piece of the furniture') == '"piece" OR "furniture"'
+
+
+def test_stopword_only_query_still_searches(indexed):
+    assert text_query('the of') == '"the" OR "of"'
+    assert 'table' in words(indexed.search_text('the of'))
+
+
+def test_query_without_words(indexed):
+    assert indexed.search_text('!!! ***') == []
+
+
+def test_rewritten_entry_is_reindexed(indexed):
+    indexed.put('table', make_entry([('a grid of rows and columns', [])]))
+    assert indexed.search_text('furniture') == []
+    assert words(indexed.search_text('columns')) == ['table']
+
+
+def test_snippet_can_come_from_an_example(indexed):
+    [result] = indexed.search_text('plates')
+    assert result['word'] == 'table'
+    assert 'plates' in result['snippet']
+
+
+def test_store_works_without_fts5(tmp_path, monkeypatch):
+    monkeypatch.setattr('entry_store.fts5_available', lambda connection: False)
+    store = EntryStore(str(tmp_path / 'entries.sqlite3'))
+    store.put('run', make_entry([('to move quickly on foot', [])]))
+    store.put('run', make_entry([('to operate', [])]))
+    assert store.get('run')['parts_of_speech'][0]['definitions'][0]['text'] == 'to operate'
+    assert not store.text_search
+    with pytest.raises(RuntimeError):
+        store.search_text('run')
+
+
+def test_text_search_endpoint_without_fts5(client, monkeypatch):
+    monkeypatch.setattr('entry_store.fts5_available', lambda connection: False)
+    response = client.get('/search/text?q=run')
+    assert response.status_code == 501
+    assert 'FTS5' in response.json['error']
+
+
+def test_text_search_endpoint(client, scrapes):
+    client.get('/search?word=hello')
+    response = client.get('/search/text?q=meaning')
+    assert [result['word'] for result in response.json['results']] == ['hello']
@@ -0,0 +1,12 @@
+"""
+WSGI entry point for production servers.
+
+    gunicorn -c gunicorn.conf.py
+
+The app is created and warmed up at import, so with preload_app the master
+process does this once and every worker forks ready to serve.
+"""
+from app import create_app, warm_up
+
+app = create_app()
+warm_up(app)